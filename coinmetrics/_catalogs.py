@@ -1,6 +1,8 @@
+from datetime import datetime
 from dateutil.parser import isoparse
-from typing import Iterable
-from coinmetrics._typing import DataFrameType, List, Any, Optional
+from functools import lru_cache, wraps
+from typing import Callable, Iterable
+from coinmetrics._typing import DataFrameType, List, Any, Optional, Tuple
 from logging import getLogger
 
 logger = getLogger("cm_client")
@@ -13,35 +15,225 @@ except ImportError:
         "Pandas export is unavailable. Install pandas to unlock dataframe functions."
     )
 
+# format="ISO8601" is only understood by pandas >= 2.0
+_PD_SUPPORTS_ISO8601 = pd is not None and int(pd.__version__.split(".")[0]) >= 2
+
+try:
+    from ciso8601 import parse_datetime as _parse_iso_datetime  # type: ignore
+except ImportError:
+    _parse_iso_datetime = None
+
+try:
+    import pyarrow  # type: ignore # noqa: F401
+
+    _HAS_PYARROW = True
+except ImportError:
+    _HAS_PYARROW = False
+
+# Arrow-backed columns store catalog strings in contiguous buffers instead of
+# one Python object per cell; requires pandas >= 2.0.
+_USE_PYARROW_DTYPES = _PD_SUPPORTS_ISO8601 and _HAS_PYARROW
+
 
 def _convert_utc(x: Any) -> DataFrameType:
     try:
-        return isoparse(x)
-    except TypeError:
+        # ciso8601 (optional) and datetime.fromisoformat are much faster
+        # than isoparse for the ISO-8601 timestamps the API returns; fall
+        # back to isoparse for anything they cannot handle.
+        if _parse_iso_datetime is not None:
+            return _parse_iso_datetime(x)
+        if x.endswith("Z"):
+            return datetime.fromisoformat(x[:-1] + "+00:00")
+        return datetime.fromisoformat(x)
+    except (TypeError, AttributeError):
         return None
+    except ValueError:
+        return isoparse(x)
 
 
-def _expand_df(key: str, iterable: Iterable[Any]) -> List[Any]:
-    def _assign_value(row: Any) -> Any:
-        try:
-            return row[key]
-        except (KeyError, TypeError):
-            return None
+def _cached_to_dataframe(func: Callable[..., DataFrameType]) -> Callable[..., DataFrameType]:
+    """
+    Memoizes to_dataframe results on the catalog instance, keyed by the call
+    arguments, so repeated conversions of the same catalog skip the whole
+    transformation pipeline. Catalog lists are not mutated after construction.
+    """
+
+    @wraps(func)
+    def wrapper(self: Any, *args: Any, **kwargs: Any) -> DataFrameType:
+        key = (args, tuple(sorted(kwargs.items())))
+        cache = self.__dict__.setdefault("_df_cache", {})
+        if key not in cache:
+            cache[key] = func(self, *args, **kwargs)
+        return cache[key]
+
+    return wrapper
+
+
+def _base_keys(records: Iterable[Any], exclude: str) -> List[str]:
+    """
+    Collects record keys in first-seen order, skipping the nested column that
+    gets flattened, so derived columns always land after the base columns.
+    """
+    keys: List[str] = []
+    seen = {exclude}
+    for record in records:
+        for key in record:
+            if key not in seen:
+                seen.add(key)
+                keys.append(key)
+    return keys
+
+
+def _flatten_metrics_frequencies(
+    records: "List[Any]",
+    frequency_keys: Iterable[str] = ("frequency", "min_time", "max_time"),
+) -> Any:
+    """
+    Flattens record -> metric -> frequency triples into one column list per
+    output column, replacing the equivalent .explode("metrics")...
+    .explode("frequencies") pipeline with a single pass over the records.
+    The column-oriented result feeds pd.DataFrame without materializing a
+    dict per output row.
+    """
+    if not records:
+        return {}
+    frequency_keys = tuple(frequency_keys)
+    derived_keys = ("metric", *frequency_keys)
+    # derived values overwrite base columns of the same name in place,
+    # matching the .assign overwrite semantics of the old pipeline
+    all_base_keys = _base_keys(records, exclude="metrics")
+    base_keys = [key for key in all_base_keys if key not in derived_keys]
+    ordered_keys = (
+        *all_base_keys,
+        *(key for key in derived_keys if key not in all_base_keys),
+    )
+    columns: Any = {key: [] for key in ordered_keys}
+    for record in records:
+        for metric in record.get("metrics") or [None]:
+            metric_value = metric.get("metric") if isinstance(metric, dict) else None
+            frequencies = (
+                metric.get("frequencies") if isinstance(metric, dict) else None
+            )
+            for frequency in frequencies or [None]:
+                for key in base_keys:
+                    columns[key].append(record.get(key))
+                columns["metric"].append(metric_value)
+                for key in frequency_keys:
+                    columns[key].append(
+                        frequency.get(key) if isinstance(frequency, dict) else None
+                    )
+    return columns
 
-    return list(map(_assign_value, iterable))
 
+def _flatten_frequencies(
+    records: "List[Any]", secondary_key: str, secondary_column: str
+) -> Any:
+    """
+    Flattens record -> frequency -> secondary item triples into one column
+    list per output column, replacing the equivalent .explode("frequencies")
+    ...explode(secondary) pipeline with a single pass over the records.
+    """
+    if not records:
+        return {}
+    derived_keys = ("frequency", secondary_column)
+    all_base_keys = _base_keys(records, exclude="frequencies")
+    base_keys = [key for key in all_base_keys if key not in derived_keys]
+    ordered_keys = (
+        *all_base_keys,
+        *(key for key in derived_keys if key not in all_base_keys),
+    )
+    columns: Any = {key: [] for key in ordered_keys}
+    for record in records:
+        for frequency in record.get("frequencies") or [None]:
+            frequency_value = (
+                frequency.get("frequency") if isinstance(frequency, dict) else None
+            )
+            secondary = (
+                frequency.get(secondary_key) if isinstance(frequency, dict) else None
+            )
+            for item in secondary or [None]:
+                for key in base_keys:
+                    columns[key].append(record.get(key))
+                columns["frequency"].append(frequency_value)
+                columns[secondary_column].append(item)
+    return columns
 
-def convert_catalog_dtypes(df: DataFrameType) -> DataFrameType:
-    df = df.convert_dtypes()
-    columns = df.columns
+
+def _expand_df(key: str, iterable: Iterable[Any]) -> List[Any]:
+    return [row.get(key) if isinstance(row, dict) else None for row in iterable]
+
+
+# Known catalog column dtypes — casting directly is much cheaper than
+# letting convert_dtypes() infer nullable dtypes from every cell.
+_CATALOG_STRING_DTYPE = "string[pyarrow]" if _USE_PYARROW_DTYPES else "string"
+_CATALOG_DTYPES = {
+    col: _CATALOG_STRING_DTYPE
+    for col in (
+        "asset",
+        "exchange",
+        "market",
+        "pair",
+        "exchange_asset",
+        "institution",
+        "metric",
+        "frequency",
+        "min_height",
+        "max_height",
+        "min_hash",
+        "max_hash",
+    )
+}
+
+
+@lru_cache(maxsize=None)
+def _detect_datetime_cols(columns: Tuple[str, ...]) -> Tuple[str, ...]:
+    # catalog schemas repeat across calls, so the detection runs once per
+    # distinct column layout instead of once per dataframe
     date_cols = {"expiration", "listing"}
-    datetime_cols = [c for c in columns if "time" in c.split("_") or c == "time" or c in date_cols]
+    return tuple(
+        c for c in columns if "time" in c.split("_") or c == "time" or c in date_cols
+    )
+
+
+def convert_catalog_dtypes(
+    df: DataFrameType, datetime_cols: Optional[Tuple[str, ...]] = None
+) -> DataFrameType:
+    dtype_map = {
+        col: dtype for col, dtype in _CATALOG_DTYPES.items() if col in df.columns
+    }
+    try:
+        df = df.astype(dtype_map)
+    except (TypeError, ValueError):
+        if _USE_PYARROW_DTYPES:
+            df = df.convert_dtypes(dtype_backend="pyarrow")
+        else:
+            df = df.convert_dtypes()
+    if datetime_cols is None:
+        datetime_cols = _detect_datetime_cols(tuple(df.columns))
+    datetime_kwargs = {"format": "ISO8601"} if _PD_SUPPORTS_ISO8601 else {}
     for col in datetime_cols:
-        df[col] = df[col].apply(_convert_utc)
+        try:
+            df[col] = pd.to_datetime(df[col], utc=True, errors="coerce", **datetime_kwargs)
+            if _USE_PYARROW_DTYPES:
+                df[col] = df[col].astype("timestamp[ns, UTC][pyarrow]")
+        except (TypeError, ValueError):
+            df[col] = df[col].apply(_convert_utc)
     return df
 
 
-class CatalogAssetsData(List[Any]):
+class CatalogData(List[Any]):
+    # Known response columns; when set, from_records skips the dict-key union
+    # scan over all rows during construction.
+    _COLUMNS: Optional[Tuple[str, ...]] = None
+
+    def _to_frame(self) -> DataFrameType:
+        return pd.DataFrame.from_records(self, columns=self._COLUMNS)
+
+
+class CatalogAssetsData(CatalogData):
+    _COLUMNS = ("asset", "full_name", "metrics", "exchanges", "markets")
+
+    @_cached_to_dataframe
     def to_dataframe(self, secondary_level: Optional[str] = None) -> DataFrameType:
         """
         Transforms catalog data in list form into a dataframe
@@ -50,7 +242,7 @@ class CatalogAssetsData(List[Any]):
         :type secondary_level: str
         :return: Catalog Data
         """
-        df_assets = pd.DataFrame(self)
+        df_assets = self._to_frame()
         if secondary_level is None:
             pass
         elif secondary_level == "markets":
@@ -58,15 +250,13 @@ class CatalogAssetsData(List[Any]):
                 df_assets.explode("markets")
                 .fillna({"markets": ""})
                 .rename({"markets": "market"}, axis=1)
-                .assign(
-                    exchange=lambda x: x["market"].apply(lambda row: row.split("-")[0])
-                )
+                .assign(exchange=lambda x: x["market"].str.split("-", n=1).str[0])
                 .drop("exchanges", axis=1)
                 .reset_index(drop=True)
             )
 
         elif secondary_level == "metrics":
-            asset_mapper = df_assets.asset.to_dict()
+            assets = df_assets["asset"].to_numpy()
 
             def _assign_metric(x: Any) -> Any:
                 try:
@@ -78,48 +268,32 @@ class CatalogAssetsData(List[Any]):
                 metrics=lambda x: pd.Series(x["metrics"])
             )
             df_assets["metric"] = df_assets["metrics"].apply(_assign_metric)
-            df_assets_metrics = df_assets.dropna(subset=["metrics"]).metrics.apply(
-                pd.Series
-            )
-            df_assets_metrics["asset"] = df_assets_metrics.index.map(asset_mapper)
-            df_assets_metrics = (
-                df_assets_metrics.explode("frequencies")
-                .assign(
-                    frequency=lambda df: _expand_df(
-                        key="frequency", iterable=df.frequencies
-                    )
-                )
-                .assign(
-                    min_time=lambda df: _expand_df(
-                        key="min_time", iterable=df.frequencies
-                    )
-                )
-                .assign(
-                    max_time=lambda df: _expand_df(
-                        key="max_time", iterable=df.frequencies
-                    )
-                )
-                .assign(
-                    min_height=lambda df: _expand_df(
-                        key="min_height", iterable=df.frequencies
-                    )
-                )
-                .assign(
-                    max_height=lambda df: _expand_df(
-                        key="max_height", iterable=df.frequencies
-                    )
-                )
-                .assign(
-                    min_hash=lambda df: _expand_df(
-                        key="min_hash", iterable=df.frequencies
-                    )
-                )
-                .assign(
-                    max_hash=lambda df: _expand_df(
-                        key="max_hash", iterable=df.frequencies
-                    )
-                )
-                .drop(["frequencies"], axis=1)
+            valid_metrics = df_assets["metrics"].notna()
+            df_assets_metrics = pd.json_normalize(
+                df_assets.loc[valid_metrics, "metrics"].tolist()
+            )
+            df_assets_metrics.index = df_assets.index[valid_metrics]
+            # the index still holds the positional row numbers from explode,
+            # so a NumPy gather maps each metric row back to its asset
+            df_assets_metrics["asset"] = assets[df_assets_metrics.index.to_numpy()]
+            df_assets_metrics = df_assets_metrics.explode("frequencies").reset_index(
+                drop=True
+            )
+            frequency_cols = [
+                "frequency",
+                "min_time",
+                "max_time",
+                "min_height",
+                "max_height",
+                "min_hash",
+                "max_hash",
+            ]
+            df_frequencies = pd.json_normalize(
+                row if isinstance(row, dict) else {}
+                for row in df_assets_metrics["frequencies"]
+            ).reindex(columns=frequency_cols)
+            df_assets_metrics = df_assets_metrics.drop(["frequencies"], axis=1).join(
+                df_frequencies
             )
             df_assets = (
                 df_assets.drop(["metrics"], axis=1)
@@ -135,67 +309,74 @@ class CatalogAssetsData(List[Any]):
         return df_assets
 
 
-class CatalogAssetAlertsData(List[Any]):
+class CatalogAssetAlertsData(CatalogData):
+    @_cached_to_dataframe
     def to_dataframe(self) -> DataFrameType:
         """
         Transforms catalog data in list form into a dataframe
         :return: Catalog Data
         """
-        return convert_catalog_dtypes(pd.DataFrame(self))
+        return convert_catalog_dtypes(self._to_frame())
 
 
-class CatalogAssetChainsData(List[Any]):
+class CatalogAssetChainsData(CatalogData):
+    @_cached_to_dataframe
     def to_dataframe(self) -> DataFrameType:
         """
         Transforms catalog data in list form into a dataframe
         :return: Catalog Data
         """
-        return convert_catalog_dtypes(pd.DataFrame(self))
+        return convert_catalog_dtypes(self._to_frame())
 
 
-class CatalogMempoolFeeratesData(List[Any]):
+class CatalogMempoolFeeratesData(CatalogData):
+    @_cached_to_dataframe
     def to_dataframe(self) -> DataFrameType:
         """
         Transforms catalog data in list form into a dataframe
         :return: Catalog Data
         """
-        return convert_catalog_dtypes(pd.DataFrame(self))
+        return convert_catalog_dtypes(self._to_frame())
 
 
-class CatalogMiningPoolTipsData(List[Any]):
+class CatalogMiningPoolTipsData(CatalogData):
+    @_cached_to_dataframe
     def to_dataframe(self) -> DataFrameType:
         """
         Transforms catalog data in list form into a dataframe
         :return: Catalog Data
         """
-        return convert_catalog_dtypes(pd.DataFrame(self))
+        return convert_catalog_dtypes(self._to_frame())
 
 
-class CatalogTransactionTrackerData(List[Any]):
+class CatalogTransactionTrackerData(CatalogData):
+    @_cached_to_dataframe
     def to_dataframe(self) -> DataFrameType:
         """
         Transforms catalog data in list form into a dataframe
         :return: Catalog Data
         """
-        return convert_catalog_dtypes(pd.DataFrame(self))
+        return convert_catalog_dtypes(self._to_frame())
 
 
-class CatalogMarketTradesData(List[Any]):
+class CatalogMarketTradesData(CatalogData):
+    @_cached_to_dataframe
     def to_dataframe(self) -> DataFrameType:
         """
         Transforms catalog data in list form into a dataframe
         :return: Catalog Data
         """
-        return convert_catalog_dtypes(pd.DataFrame(self))
+        return convert_catalog_dtypes(self._to_frame())
 
 
-class CatalogMarketOrderbooksData(List[Any]):
+class CatalogMarketOrderbooksData(CatalogData):
+    @_cached_to_dataframe
     def to_dataframe(self, secondary_level: Optional[str] = None) -> DataFrameType:
         """
         Transforms catalog data in list form into a dataframe
         :return: Catalog Data
         """
-        df_assets = pd.DataFrame(self)
+        df_assets = self._to_frame()
         if secondary_level is None:
             pass
         elif secondary_level == "depths":
@@ -219,40 +400,19 @@ class CatalogMarketOrderbooksData(List[Any]):
         return convert_catalog_dtypes(df_assets)
 
 
-class CatalogAssetPairsData(List[Any]):
+class CatalogAssetPairsData(CatalogData):
+    @_cached_to_dataframe
     def to_dataframe(self) -> DataFrameType:
         """
         Transforms catalog data in list form into a dataframe
         :return: Catalog Data
         """
-        df_asset_pairs = (
-            pd.DataFrame(self)
-            .explode("metrics")
-            .assign(metric=lambda df: _expand_df(key="metric", iterable=df.metrics))
-            .assign(
-                frequencies=lambda df: _expand_df(
-                    key="frequencies", iterable=df.metrics
-                )
-            )
-            .explode("frequencies")
-            .assign(
-                frequency=lambda df: _expand_df(
-                    key="frequency", iterable=df.frequencies
-                )
-            )
-            .assign(
-                min_time=lambda df: _expand_df(key="min_time", iterable=df.frequencies)
-            )
-            .assign(
-                max_time=lambda df: _expand_df(key="max_time", iterable=df.frequencies)
-            )
-            .reset_index(drop=True)
-            .drop(["metrics", "frequencies"], axis=1)
-        )
+        df_asset_pairs = pd.DataFrame(_flatten_metrics_frequencies(self))
         return convert_catalog_dtypes(df_asset_pairs)
 
 
-class CatalogExchangesData(List[Any]):
+class CatalogExchangesData(CatalogData):
+    @_cached_to_dataframe
     def to_dataframe(self, secondary_level: Optional[str] = None) -> DataFrameType:
         """
         Transforms catalog data in list form into a dataframe
@@ -261,7 +421,7 @@ class CatalogExchangesData(List[Any]):
         :type secondary_level: str
         :return: Catalog Data
         """
-        df_exchanges = pd.DataFrame(self)
+        df_exchanges = self._to_frame()
         if secondary_level is None:
             pass
         elif secondary_level == "markets":
@@ -269,80 +429,33 @@ class CatalogExchangesData(List[Any]):
                 {"markets": "market"}, axis=1
             )
         elif secondary_level == "metrics":
-            df_exchanges = (
-                df_exchanges.explode("metrics")
-                .assign(metric=lambda df: _expand_df(key="metric", iterable=df.metrics))
-                .assign(
-                    frequencies=lambda df: _expand_df(
-                        key="frequencies", iterable=df.metrics
-                    )
-                )
-                .explode("frequencies")
-                .assign(
-                    frequency=lambda df: _expand_df(
-                        key="frequency", iterable=df.frequencies
-                    )
-                )
-                .assign(
-                    min_time=lambda df: _expand_df(
-                        key="min_time", iterable=df.frequencies
-                    )
-                )
-                .assign(
-                    max_time=lambda df: _expand_df(
-                        key="max_time", iterable=df.frequencies
-                    )
-                )
-                .reset_index(drop=True)
-                .drop(["metrics", "frequencies"], axis=1)
-            )
+            df_exchanges = pd.DataFrame(_flatten_metrics_frequencies(self))
         else:
             raise ValueError("secondary_level must be one of 'markets' or 'metrics")
         df_exchanges = convert_catalog_dtypes(df_exchanges)
         return df_exchanges
 
 
-class CatalogExchangeAssetsData(List[Any]):
+class CatalogExchangeAssetsData(CatalogData):
+    @_cached_to_dataframe
     def to_dataframe(self) -> DataFrameType:
         """
         Transforms catalog data in list form into a dataframe
         :return: Catalog Data
         """
-        df_exchange_assets = pd.DataFrame(self)
-        df_exchange_assets = (
-            df_exchange_assets.explode("metrics")
-            .assign(metric=lambda df: _expand_df(key="metric", iterable=df.metrics))
-            .assign(
-                frequencies=lambda df: _expand_df(
-                    key="frequencies", iterable=df.metrics
-                )
-            )
-            .explode("frequencies")
-            .assign(
-                frequency=lambda df: _expand_df(
-                    key="frequency", iterable=df.frequencies
-                )
-            )
-            .assign(
-                min_time=lambda df: _expand_df(key="min_time", iterable=df.frequencies)
-            )
-            .assign(
-                max_time=lambda df: _expand_df(key="max_time", iterable=df.frequencies)
-            )
-            .reset_index(drop=True)
-            .drop(["metrics", "frequencies"], axis=1)
-        )
+        df_exchange_assets = pd.DataFrame(_flatten_metrics_frequencies(self))
         return convert_catalog_dtypes(df_exchange_assets)
 
 
-class CatalogIndexesData(List[Any]):
+class CatalogIndexesData(CatalogData):
     """
     Transforms catalog data in list form into a dataframe
     :return: Catalog Data
     """
 
+    @_cached_to_dataframe
     def to_dataframe(self) -> DataFrameType:
-        df_indexes = pd.DataFrame(self)
+        df_indexes = self._to_frame()
         df_indexes = (
             df_indexes.explode("frequencies")
             .assign(
@@ -362,53 +475,39 @@ class CatalogIndexesData(List[Any]):
         return convert_catalog_dtypes(df_indexes)
 
 
-class CatalogInstitutionsData(List[Any]):
+class CatalogInstitutionsData(CatalogData):
     """
     Transforms catalog data in list form into a dataframe
     :return: Catalog Data
     """
 
+    @_cached_to_dataframe
     def to_dataframe(self) -> DataFrameType:
-        df_institutions = pd.DataFrame(self)
-        df_institutions = (
-            df_institutions.explode("metrics")
-            .assign(metric=lambda df: _expand_df(key="metric", iterable=df.metrics))
-            .assign(
-                frequencies=lambda df: _expand_df(
-                    key="frequencies", iterable=df.metrics
-                )
-            )
-            .explode("frequencies")
-            .assign(
-                frequency=lambda df: _expand_df(
-                    key="frequency", iterable=df.frequencies
-                )
-            )
-            .assign(
-                min_time=lambda df: _expand_df(key="min_time", iterable=df.frequencies)
-            )
-            .assign(
-                max_time=lambda df: _expand_df(key="max_time", iterable=df.frequencies)
-            )
-            .reset_index(drop=True)
-            .drop(["metrics", "frequencies"], axis=1)
-        )
+        df_institutions = pd.DataFrame(_flatten_metrics_frequencies(self))
         return convert_catalog_dtypes(df_institutions)
 
 
-class CatalogMarketsData(List[Any]):
+class CatalogMarketsData(CatalogData):
     """
     Transforms catalog data in list form into a dataframe
     :return: Catalog Data
     """
 
+    @_cached_to_dataframe
     def to_dataframe(self) -> DataFrameType:
-        df_markets = pd.DataFrame(self)
+        df_markets = self._to_frame()
         metadata = ["trades", "funding_rates", "openinterest", "liquidations"]
         for col in metadata:
             if col in df_markets.columns:
-                for time_col in ["min_time", "max_time"]:
-                    df_markets[f'{time_col}_{col}'] = df_markets[col].apply(lambda item: None if isinstance(item, float) else item.get(time_col, None))
+                df_times = (
+                    pd.json_normalize(
+                        item if isinstance(item, dict) else {}
+                        for item in df_markets[col]
+                    )
+                    .reindex(columns=["min_time", "max_time"])
+                    .add_suffix(f"_{col}")
+                )
+                df_markets = df_markets.join(df_times)
 
         df_markets = df_markets.drop(
             ["trades", "funding_rates", "openinterest", "liquidations"],
@@ -418,148 +517,87 @@ class CatalogMarketsData(List[Any]):
         return convert_catalog_dtypes(df_markets)
 
 
-class CatalogMetricsData(List[Any]):
+class CatalogMetricsData(CatalogData):
     """
     Transforms catalog data in list form into a dataframe
     :return: Catalog Data
     """
 
+    @_cached_to_dataframe
     def to_dataframe(self) -> DataFrameType:
-        df_catalog_metrics = (
-            pd.DataFrame(self)
-            .explode("frequencies")
-            .assign(
-                frequency=lambda df: _expand_df(
-                    key="frequency", iterable=df.frequencies
-                )
-            )
-            .assign(asset=lambda df: _expand_df(key="assets", iterable=df.frequencies))
-            .explode("asset")
-            .drop("frequencies", axis=1)
-            .reset_index(drop=True)
+        df_catalog_metrics = pd.DataFrame(
+            _flatten_frequencies(self, secondary_key="assets", secondary_column="asset")
         )
         return convert_catalog_dtypes(df_catalog_metrics)
 
 
-class CatalogExchangeAssetMetricsData(List[Any]):
+class CatalogExchangeAssetMetricsData(CatalogData):
     """
     Transforms catalog exchange asset data in list form into a dataframe
     :return: Catalog Data
     """
 
+    @_cached_to_dataframe
     def to_dataframe(self) -> DataFrameType:
-        df_catalog_metrics = (
-            pd.DataFrame(self)
-            .explode("frequencies")
-            .assign(
-                frequency=lambda df: _expand_df(
-                    key="frequency", iterable=df.frequencies
-                )
+        df_catalog_metrics = pd.DataFrame(
+            _flatten_frequencies(
+                self, secondary_key="exchange-assets", secondary_column="exchange_asset"
             )
-            .assign(
-                exchange_asset=lambda df: _expand_df(
-                    key="exchange-assets", iterable=df.frequencies
-                )
-            )
-            .explode("exchange_asset")
-            .drop("frequencies", axis=1)
-            .reset_index(drop=True)
         )
         return convert_catalog_dtypes(df_catalog_metrics)
 
 
-class CatalogPairMetricsData(List[Any]):
+class CatalogPairMetricsData(CatalogData):
     """
     Transforms catalog pair asset data in list form into a dataframe
     :return: Catalog Data
     """
 
+    @_cached_to_dataframe
     def to_dataframe(self) -> DataFrameType:
-        df_catalog_metrics = (
-            pd.DataFrame(self)
-            .explode("frequencies")
-            .assign(
-                frequency=lambda df: _expand_df(
-                    key="frequency", iterable=df.frequencies
-                )
-            )
-            .assign(pair=lambda df: _expand_df(key="pairs", iterable=df.frequencies))
-            .explode("pair")
-            .drop("frequencies", axis=1)
-            .reset_index(drop=True)
+        df_catalog_metrics = pd.DataFrame(
+            _flatten_frequencies(self, secondary_key="pairs", secondary_column="pair")
         )
         return convert_catalog_dtypes(df_catalog_metrics)
 
 
-class CatalogInstitutionMetricsData(List[Any]):
+class CatalogInstitutionMetricsData(CatalogData):
     """
     Transforms catalog institution asset data in list form into a dataframe
     :return: Catalog Data
     """
 
+    @_cached_to_dataframe
     def to_dataframe(self) -> DataFrameType:
-        df_catalog_metrics = (
-            pd.DataFrame(self)
-            .explode("frequencies")
-            .assign(
-                frequency=lambda df: _expand_df(
-                    key="frequency", iterable=df.frequencies
-                )
+        df_catalog_metrics = pd.DataFrame(
+            _flatten_frequencies(
+                self, secondary_key="institutions", secondary_column="institution"
             )
-            .assign(
-                institution=lambda df: _expand_df(
-                    key="institutions", iterable=df.frequencies
-                )
-            )
-            .explode("institution")
-            .drop("frequencies", axis=1)
-            .reset_index(drop=True)
         )
         return convert_catalog_dtypes(df_catalog_metrics)
 
 
-class CatalogMarketMetricsData(List[Any]):
+class CatalogMarketMetricsData(CatalogData):
     """
     Transforms catalog data in list form into a dataframe
     :return: Catalog Data
     """
 
+    @_cached_to_dataframe
     def to_dataframe(self) -> DataFrameType:
-        df_catalog_market_metrics = pd.DataFrame(self)
-        df_catalog_market_metrics = (
-            df_catalog_market_metrics.explode("metrics")
-            .assign(metric=lambda df: _expand_df(key="metric", iterable=df.metrics))
-            .assign(
-                frequencies=lambda df: _expand_df(
-                    key="frequencies", iterable=df.metrics
-                )
-            )
-            .explode("frequencies")
-            .assign(
-                frequency=lambda df: _expand_df(
-                    key="frequency", iterable=df.frequencies
-                )
-            )
-            .assign(
-                min_time=lambda df: _expand_df(key="min_time", iterable=df.frequencies)
-            )
-            .assign(
-                max_time=lambda df: _expand_df(key="max_time", iterable=df.frequencies)
-            )
-            .reset_index(drop=True)
-            .drop(["metrics", "frequencies"], axis=1)
-        )
+        df_catalog_market_metrics = pd.DataFrame(_flatten_metrics_frequencies(self))
         return convert_catalog_dtypes(df_catalog_market_metrics)
 
 
-class CatalogMarketCandlesData(List[Any]):
+class CatalogMarketCandlesData(CatalogData):
     """
     Transforms catalog data in list form into a dataframe
     :return: Catalog Data
     """
 
+    @_cached_to_dataframe
     def to_dataframe(self) -> DataFrameType:
-        df_catalog_market_candles = pd.DataFrame(self)
+        df_catalog_market_candles = self._to_frame()
         df_catalog_market_candles = (
             df_catalog_market_candles.explode("frequencies")
             .assign(
@@ -579,14 +617,15 @@ class CatalogMarketCandlesData(List[Any]):
         return convert_catalog_dtypes(df_catalog_market_candles)
 
 
-class CatalogAssetPairCandlesData(List[Any]):
+class CatalogAssetPairCandlesData(CatalogData):
     """
     Transforms catalog data in list form into a dataframe
     :return: Catalog Data
     """
 
+    @_cached_to_dataframe
     def to_dataframe(self) -> DataFrameType:
-        df_catalog_asset_candles = pd.DataFrame(self)
+        df_catalog_asset_candles = self._to_frame()
         df_catalog_asset_candles = (
             df_catalog_asset_candles.explode("frequencies")
             .assign(
@@ -606,19 +645,21 @@ class CatalogAssetPairCandlesData(List[Any]):
         return convert_catalog_dtypes(df_catalog_asset_candles)
 
 
-class CatalogMarketContractPrices(List[Any]):
+class CatalogMarketContractPrices(CatalogData):
+    @_cached_to_dataframe
     def to_dataframe(self) -> DataFrameType:
         """
         Transforms catalog data in list form into a dataframe
         :return: Catalog Data
         """
-        return convert_catalog_dtypes(pd.DataFrame(self))
+        return convert_catalog_dtypes(self._to_frame())
 
 
-class CatalogMarketImpliedVolatility(List[Any]):
+class CatalogMarketImpliedVolatility(CatalogData):
+    @_cached_to_dataframe
     def to_dataframe(self) -> DataFrameType:
         """
         Transforms catalog data in list form into a dataframe
         :return: Catalog Data
         """
-        return convert_catalog_dtypes(pd.DataFrame(self))
+        return convert_catalog_dtypes(self._to_frame())
@@ -18,9 +18,12 @@ from coinmetrics._typing import (
 from coinmetrics._utils import get_file_path_or_buffer
 from coinmetrics._models import AssetChainsData, CoinMetricsAPIModel, TransactionTrackerData
 try:
-    import orjson as json
+    from orjson import dumps as _json_dumps  # serializes straight to bytes in C
 except ImportError:
-    import json  # type: ignore
+    import json
+
+    def _json_dumps(data: Any) -> bytes:  # type: ignore
+        return json.dumps(data).encode()
 
 
 logger = getLogger("cm_client_data_collection")
@@ -165,7 +168,7 @@ class DataCollection:
     ) -> Optional[str]:
         def _gen_json_lines() -> Iterable[bytes]:
             for data_row in self:
-                yield json.dumps(data_row) + b"\n"
+                yield _json_dumps(data_row) + b"\n"
 
         return self._export_to_file(_gen_json_lines(), path_or_bufstr, compress)
 
@@ -15,10 +15,13 @@ from coinmetrics import __version__ as version
 from coinmetrics._exceptions import CoinMetricsClientQueryParamsException
 
 try:
-    import ujson as json
+    import orjson as json
 except ImportError:
-    # fall back to std json package
-    import json  # type: ignore
+    try:
+        import ujson as json  # type: ignore
+    except ImportError:
+        # fall back to std json package
+        import json  # type: ignore
 
 from coinmetrics._typing import (
     DataReturnType,
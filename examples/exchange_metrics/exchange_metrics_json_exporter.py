@@ -1,13 +1,16 @@
 import logging
 import sys
 import datetime as dt
-from typing import List, Dict
+from typing import List, Dict, Tuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from datetime import datetime
-from multiprocessing import Pool
 from os import environ, makedirs
 from os.path import abspath, join
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from coinmetrics.api_client import CoinMetricsClient
 from coinmetrics.constants import PagingFrom
@@ -28,7 +31,18 @@ api_key = (
     environ.get("CM_API_KEY") or sys.argv[1]
 )  # sys.argv[1] is executed only if CM_API_KEY is not found
 
-client = CoinMetricsClient(api_key)
+# size the connection pool to the worker-thread count so concurrent paged
+# exports reuse keep-alive connections instead of re-doing TLS handshakes
+session = requests.Session()
+adapter = HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=16,
+    max_retries=Retry(total=3, backoff_factor=0.3),
+)
+session.mount("https://", adapter)
+session.mount("http://", adapter)
+
+client = CoinMetricsClient(api_key, session=session)
 
 DST_ROOT = "./data"
 
@@ -41,6 +55,15 @@ START_DATE = dt.date(year=2018, month=1, day=1)
 END_DATE = dt.date.today()
 
 
+@lru_cache(maxsize=None)
+def get_catalog_exchanges(exchanges: Tuple[str, ...] = ()):
+    """
+    Fetches catalog_exchanges once per distinct exchange set so repeated
+    mapping lookups reuse a single HTTP round trip.
+    """
+    return client.catalog_exchanges(exchanges=list(exchanges))
+
+
 def get_exchange_metrics_mapping(exchanges: List[str]=[], frequency: str = "1d") -> Dict[str, List[str]]:
     """
     Gets a mapping of all the metrics available for provided exchnages at the specified frequency
@@ -49,7 +72,7 @@ def get_exchange_metrics_mapping(exchanges: List[str]=[], frequency: str = "1d")
     :return: Dictionary that maps name of exchange to a list of available metrics
     """
     result_dict = {}
-    exchange_data = client.catalog_exchanges(exchanges=exchanges)
+    exchange_data = get_catalog_exchanges(tuple(sorted(exchanges)))
     for data in exchange_data:
         exchange_metrics = data.get("metrics")
         if exchange_metrics:
@@ -66,7 +89,8 @@ def export_data(exchanges: List[str], frequency: str = "1d", start_date: datetim
     logger.info("retrieving metric names")
     exchange_and_metrics = get_exchange_metrics_mapping(exchanges=exchanges, frequency=frequency)
     makedirs(DST_ROOT, exist_ok=True)
-    for exchange, metrics in exchange_and_metrics.items():
+
+    def _export_one(exchange: str, metrics: List[str]) -> None:
         dst_file = join(DST_ROOT, "{}_exchange_metrics.json".format(exchange))
         logger.info(
             "exporting metrics into a json file (): %s",
@@ -84,6 +108,17 @@ def export_data(exchanges: List[str], frequency: str = "1d", start_date: datetim
             )
             asset_metrics.export_to_json(dst_file_buffer)
 
+    # each exchange streams to its own file, so the exports can run in
+    # parallel; the work is I/O bound and threads are enough
+    max_workers = min(16, max(1, len(exchange_and_metrics)))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        tasks = [
+            executor.submit(_export_one, exchange, metrics)
+            for exchange, metrics in exchange_and_metrics.items()
+        ]
+        for task in as_completed(tasks):
+            task.result()
+
 
 if __name__ == "__main__":
     export_start_time = datetime.now()